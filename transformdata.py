@@ -5,8 +5,11 @@ import time
 import ctypes
 import sqlite3
 import logging
+import re
 import glob
+import hashlib
 import argparse
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import xml.etree.ElementTree as ET
 
 # -----------------------------------------------------------
@@ -455,53 +458,158 @@ class DataTransformer:
         logging.info(f"Starting data generation for {rows} rows")
         start_time = time.time()
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
-            headers = config['headers']
-            patterns = config['patterns']
-            # convert headers/patterns to compatible C types
-            num_headers = len(headers)
-            c_headers = (ctypes.c_char_p * num_headers)()
-            c_patterns = (ctypes.c_char_p * num_headers)()
-            for i, h in enumerate(headers):
-                c_headers[i] = h.encode()
-                c_patterns[i] = patterns[h].encode()
-
-            # call C function for random data generation
-            row_ptr_type = ctypes.POINTER(ctypes.c_char_p)
-            data_pointer = row_ptr_type()
-            if self.lib.generate_all_data(
-                    c_headers, c_patterns, num_headers,
-                    rows, ctypes.byref(data_pointer)) != 0:
-                raise RuntimeError("Data generation failed in C library.")
-
-            # convert returned data to python structure
-            data = []
-            for i in range(rows):
-                row_data = {}
-                for j, header in enumerate(headers):
-                    row_data[header] = data_pointer[i * num_headers + j].decode()
-                data.append(row_data)
-
-            # write output
-            if output_format == 'csv':
-                with open(output_path, 'w', newline='', buffering=8192) as csv_file:
-                    writer = csv.DictWriter(csv_file, fieldnames=headers)
-                    writer.writeheader()
-                    writer.writerows(data)
-            elif output_format == 'json':
-                with open(output_path, 'w', buffering=8192) as json_file:
-                    json.dump(data, json_file, indent=4)
-            elif output_format == 'xml':
-                self.write_xml(data, output_path)
-            elif output_format == 'sqlite':
-                self.write_sqlite(data, output_path, 'data')
+            headers, patterns = self._load_patterns()
+            data = self._generate_rows(headers, patterns, rows)
+            self._write_generated(data, headers, output_path, output_format)
             elapsed_time = (time.time() - start_time) * 1000
             logging.info(f"Data generation completed in {elapsed_time:.2f} ms")
         except Exception as e:
             logging.error(f"Error during data generation: {str(e)}")
             raise
 
+    def _load_patterns(self):
+        """Load headers and their regex patterns from the current config file."""
+        with open(self.config_path, 'r') as f:
+            config = json.load(f)
+        return config['headers'], config['patterns']
+
+    def _generate_rows(self, headers, patterns, rows):
+        """Generate the given number of rows through the C library."""
+        # convert headers/patterns to compatible C types
+        num_headers = len(headers)
+        c_headers = (ctypes.c_char_p * num_headers)()
+        c_patterns = (ctypes.c_char_p * num_headers)()
+        for i, h in enumerate(headers):
+            c_headers[i] = h.encode()
+            c_patterns[i] = patterns[h].encode()
+
+        # call C function for random data generation
+        row_ptr_type = ctypes.POINTER(ctypes.c_char_p)
+        data_pointer = row_ptr_type()
+        if self.lib.generate_all_data(
+                c_headers, c_patterns, num_headers,
+                rows, ctypes.byref(data_pointer)) != 0:
+            raise RuntimeError("Data generation failed in C library.")
+
+        # convert returned data to python structure
+        data = []
+        for i in range(rows):
+            row_data = {}
+            for j, header in enumerate(headers):
+                row_data[header] = data_pointer[i * num_headers + j].decode()
+            data.append(row_data)
+        return data
+
+    def _write_generated(self, data, headers, output_path, output_format):
+        """Write generated rows in the specified format."""
+        if output_format == 'csv':
+            with open(output_path, 'w', newline='', buffering=8192) as csv_file:
+                writer = csv.DictWriter(csv_file, fieldnames=headers)
+                writer.writeheader()
+                writer.writerows(data)
+        elif output_format == 'json':
+            with open(output_path, 'w', buffering=8192) as json_file:
+                json.dump(data, json_file, indent=4)
+        elif output_format == 'xml':
+            self.write_xml(data, output_path)
+        elif output_format == 'sqlite':
+            self.write_sqlite(data, output_path, 'data')
+
+    # Sharded output: the rows are split into several similarly sized files
+    # (output_00000.csv, output_00001.csv, ...) for parallel loaders downstream.
+    # Shards are written by a thread pool, so writing overlaps with generating the next shard
+    # (or reading it, for CSV input split by --shard-rows), and a manifest with the path, row count and byte size of each shard is written alongside them.
+    def shard_row_counts(self, total_rows, shard_rows=None, shards=None):
+        """Split a row count into per-shard row counts by rows per shard or number of shards."""
+        if shard_rows is not None:
+            if shard_rows < 1:
+                raise ValueError("Rows per shard must be a positive integer.")
+            return [min(shard_rows, total_rows - start) for start in range(0, total_rows, shard_rows)]
+        if shards is not None:
+            if shards < 1:
+                raise ValueError("Number of shards must be a positive integer.")
+            base, extra = divmod(total_rows, shards)
+            counts = [base + 1 if i < extra else base for i in range(shards)]
+            return [count for count in counts if count > 0]
+        return [total_rows] if total_rows else []
+
+    def _shard_path(self, output_path, index):
+        """Get the path of a single shard, e.g. output.csv -> output_00000.csv."""
+        base, ext = os.path.splitext(output_path)
+        return f"{base}_{index:05d}{ext}"
+
+    def _manifest_path(self, output_path):
+        """Get the path of the shard manifest, e.g. output.csv -> output_csv_manifest.json."""
+        base, ext = os.path.splitext(output_path)
+        return f"{base}_{ext.lstrip('.')}_manifest.json"
+
+    def _remove_stale_shards(self, output_path):
+        """Remove shards left by an earlier run, so loaders globbing the shard names only find the new ones."""
+        base, ext = os.path.splitext(output_path)
+        # indexes are zero padded to at least 5 digits and grow wider past 99999 shards
+        shard_regex = re.compile(re.escape(base) + r'_\d{5,}' + re.escape(ext))
+        for shard_path in glob.glob(f"{glob.escape(base)}_[0-9]*{glob.escape(ext)}"):
+            if shard_regex.fullmatch(shard_path):
+                os.remove(shard_path)
+
+    def _wait_for_shard_slot(self, futures, shard_entries, max_workers):
+        """Wait for the oldest pending shard once max_workers shards are in flight, keeping memory bounded."""
+        if len(futures) - len(shard_entries) >= max_workers:
+            shard_entries.append(futures[len(shard_entries)].result())
+
+    def _write_shard(self, write_func, data, shard_path):
+        """Write a single shard and return its manifest entry."""
+        write_func(data, shard_path)
+        size = os.path.getsize(shard_path) if os.path.exists(shard_path) else 0
+        return {'path': shard_path, 'rows': len(data), 'bytes': size}
+
+    def _write_manifest(self, output_path, output_format, shard_entries):
+        """Write the manifest listing all shards and return its path."""
+        manifest_path = self._manifest_path(output_path)
+        manifest = {
+            'format': output_format,
+            'total_rows': sum(entry['rows'] for entry in shard_entries),
+            'total_bytes': sum(entry['bytes'] for entry in shard_entries),
+            'shards': shard_entries
+        }
+        self.write_json(manifest, manifest_path)
+        return manifest_path
+
+    def generate_data_sharded(self, rows, output_path, output_format, shard_rows=None, shards=None, max_workers=None):
+        """Generate mock data into multiple shard files written concurrently."""
+        logging.info(f"Starting sharded data generation for {rows} rows")
+        start_time = time.time()
+        try:
+            headers, patterns = self._load_patterns()
+            counts = self.shard_row_counts(rows, shard_rows, shards)
+
+            def write_func(data, shard_path):
+                self._write_generated(data, headers, shard_path, output_format)
+
+            # same default as ThreadPoolExecutor, also used to limit how many generated shards are held in memory
+            max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+            self._remove_stale_shards(output_path)
+
+            # the C generation releases the GIL, so earlier shards are written while the next one is generated
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = []
+                shard_entries = []
+                for index, count in enumerate(counts):
+                    # wait for the oldest shard to be written before generating too far ahead of the writers
+                    self._wait_for_shard_slot(futures, shard_entries, max_workers)
+                    data = self._generate_rows(headers, patterns, count)
+                    shard_path = self._shard_path(output_path, index)
+                    futures.append(executor.submit(self._write_shard, write_func, data, shard_path))
+                shard_entries += [future.result() for future in futures[len(shard_entries):]]
+
+            manifest_path = self._write_manifest(output_path, output_format, shard_entries)
+            elapsed_time = (time.time() - start_time) * 1000
+            logging.info(f"Sharded data generation of {len(shard_entries)} shards completed in {elapsed_time:.2f} ms")
+            return {'manifest_path': manifest_path, 'shards': shard_entries}
+        except Exception as e:
+            logging.error(f"Error during data generation: {str(e)}")
+            raise
+
     def _read_input(self, input_path, input_format, table=None):
         """Read input data based on format."""
         if input_format == 'csv':
@@ -527,16 +635,20 @@ class DataTransformer:
             # handle tables from SQLite, currently allows choosing multiple in the UI(probably not needed)
             if isinstance(input_data, dict):
                 base_path = os.path.splitext(output_path)[0]
+                table_outputs = []
                 for table_name, table_data in input_data.items():
                     table_output = f"{base_path}_{table_name}.{output_format}"
                     self._write_output(table_data, table_output, output_format, flatten)
+                    table_outputs.append(table_output)
                 
                 elapsed_time = (time.time() - start_time) * 1000
                 return {
                     'type': 'success',
                     'message': 'Multi-table conversion completed successfully',
+                    'output_paths': table_outputs,
                     'timing': {
                         'elapsed_ms': elapsed_time,
+                        'rows': sum(len(td) for td in input_data.values()),
                         'rows_per_second': sum(len(td) for td in input_data.values()) / (elapsed_time / 1000)
                     }
                 }
@@ -564,6 +676,7 @@ class DataTransformer:
                 'output_path': output_path,
                 'timing': {
                     'elapsed_ms': elapsed_time,
+                    'rows': len(input_data),
                     'rows_per_second': len(input_data) / (elapsed_time / 1000)
                 }
             }
@@ -572,6 +685,114 @@ class DataTransformer:
             logging.error(f"An error occurred: {str(e)}")
             raise
 
+    def convert_sharded(self, input_path, output_path, input_format, output_format, table=None, flatten=False,
+                        shard_rows=None, shards=None, max_workers=None):
+        """Convert data from one format to another, split into multiple shard files written concurrently."""
+        logging.info(f"Starting sharded conversion from {input_format} to {output_format}")
+        start_time = time.time()
+
+        try:
+            # CSV input split by rows per shard is streamed, each shard is written while the next one is read
+            if input_format == 'csv' and shard_rows is not None:
+                shard_entries = self._convert_csv_streamed(input_path, output_path, output_format, flatten,
+                                                           shard_rows, max_workers)
+                return self._sharded_convert_result(output_path, output_format, shard_entries, start_time)
+
+            input_data = self._read_input(input_path, input_format, table)
+
+            # multiple SQLite tables are sharded separately, one set of shards per table
+            if isinstance(input_data, dict):
+                base_path = os.path.splitext(output_path)[0]
+                datasets = [(f"{base_path}_{table_name}.{output_format}", table_data)
+                            for table_name, table_data in input_data.items()]
+            else:
+                datasets = [(output_path, input_data)]
+
+            if output_format in ['csv', 'sqlite']:
+                for i, (dataset_path, data) in enumerate(datasets):
+                    if isinstance(data, list) and data and self.is_semiStruct(data):
+                        if not flatten:
+                            return {
+                                'type': 'semi_data_warning',
+                                'message': 'Irregular or nested data detected. Flatten it for structured output?'
+                            }
+                        # flatten the whole dataset before splitting so every shard has the same columns
+                        datasets[i] = (dataset_path, self.flatten_data(data))
+
+            def write_func(data, shard_path):
+                self._write_output(data, shard_path, output_format)
+
+            shard_entries = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = []
+                for dataset_path, data in datasets:
+                    self._remove_stale_shards(dataset_path)
+                    start = 0
+                    for index, count in enumerate(self.shard_row_counts(len(data), shard_rows, shards)):
+                        shard_path = self._shard_path(dataset_path, index)
+                        futures.append(executor.submit(self._write_shard, write_func,
+                                                       data[start:start + count], shard_path))
+                        start += count
+                shard_entries = [future.result() for future in futures]
+
+            return self._sharded_convert_result(output_path, output_format, shard_entries, start_time)
+
+        except Exception as e:
+            logging.error(f"An error occurred: {str(e)}")
+            raise
+
+    def _sharded_convert_result(self, output_path, output_format, shard_entries, start_time):
+        """Write the manifest of a sharded conversion and build its result."""
+        manifest_path = self._write_manifest(output_path, output_format, shard_entries)
+        elapsed_time = (time.time() - start_time) * 1000
+        total_rows = sum(entry['rows'] for entry in shard_entries)
+        logging.info(f"Sharded conversion of {len(shard_entries)} shards completed in {elapsed_time:.2f} ms")
+
+        return {
+            'type': 'success',
+            'message': 'Sharded conversion completed successfully',
+            'manifest_path': manifest_path,
+            'shards': shard_entries,
+            'timing': {
+                'elapsed_ms': elapsed_time,
+                'rows_per_second': total_rows / (elapsed_time / 1000)
+            }
+        }
+
+    def _iter_csv_chunks(self, csv_path, chunk_rows):
+        """Read CSV in chunks of at most chunk_rows rows."""
+        try:
+            with open(csv_path, 'r') as csv_file:
+                chunk = []
+                for row in csv.DictReader(csv_file):
+                    chunk.append(row)
+                    if len(chunk) == chunk_rows:
+                        yield chunk
+                        chunk = []
+                if chunk:
+                    yield chunk
+        except FileNotFoundError:
+            raise ValueError(f"Input file not found: {csv_path}")
+        except csv.Error:
+            raise ValueError(f"Invalid CSV format: {csv_path}")
+
+    def _convert_csv_streamed(self, input_path, output_path, output_format, flatten, shard_rows, max_workers=None):
+        """Convert CSV into shards while reading it, returning the manifest entries."""
+        max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._remove_stale_shards(output_path)
+
+        def write_func(data, shard_path):
+            self._write_output(data, shard_path, output_format, flatten)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            shard_entries = []
+            for index, chunk in enumerate(self._iter_csv_chunks(input_path, shard_rows)):
+                self._wait_for_shard_slot(futures, shard_entries, max_workers)
+                futures.append(executor.submit(self._write_shard, write_func, chunk, self._shard_path(output_path, index)))
+            shard_entries += [future.result() for future in futures[len(shard_entries):]]
+        return shard_entries
+
     def _write_output(self, data, output_path, output_format, flatten=False):
         """Write output in specified format."""
         # check structure
@@ -597,6 +818,187 @@ class DataTransformer:
         else:
             raise ValueError(f"Unsupported output format: {output_format}")
 
+    # Batch conversion: converts every supported file in a directory or glob into one target format.
+    # Files are converted concurrently in a process pool, and a persistent cache lets unchanged inputs be
+    # skipped on rerun. The cache holds one entry per input and output format with the input content hash,
+    # size and modification time, the conversion options and the output paths, replaced on every conversion.
+    # Unchanged size and modification time skip a file without reading it, otherwise the content is hashed
+    # in the worker process before deciding whether to convert.
+    def collect_batch_inputs(self, input_pattern):
+        """List the supported input files in a directory or matching a glob pattern."""
+        if os.path.isdir(input_pattern):
+            paths = [os.path.join(input_pattern, name) for name in os.listdir(input_pattern)]
+        else:
+            paths = glob.glob(input_pattern)
+        # hidden files are skipped, so the default cache file is never picked up as an input
+        return sorted(
+            p for p in paths
+            if os.path.isfile(p) and not os.path.basename(p).startswith('.')
+            and os.path.splitext(p)[1].lower().lstrip('.') in self.supported_formats
+        )
+
+    def _hash_file(self, path):
+        """Hash the contents of a file."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _batch_output_paths(self, output_path, input_path, input_format):
+        """Get the paths converting to output_path writes, SQLite input is written as one file per table."""
+        if input_format == 'sqlite':
+            base_path, ext = os.path.splitext(output_path)
+            return [f"{base_path}_{table}{ext}" for table in self.list_sqlite_tables(input_path)]
+        return [output_path]
+
+    def _load_batch_cache(self, cache_path):
+        """Load the batch conversion cache, an unreadable cache is treated as empty."""
+        if not cache_path or not os.path.exists(cache_path):
+            return {}
+        try:
+            with open(cache_path, 'r') as f:
+                return json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            logging.warning(f"Ignoring unreadable batch cache {cache_path}: {str(e)}")
+            return {}
+
+    def batch_convert(self, input_paths, output_dir, output_format, flatten=False, cache_path=None, max_workers=None):
+        """Convert multiple files to one format concurrently and return a summary report."""
+        logging.info(f"Starting batch conversion of {len(input_paths)} files to {output_format}")
+        start_time = time.time()
+        os.makedirs(output_dir, exist_ok=True)
+        cache = self._load_batch_cache(cache_path)
+
+        # entries of deleted inputs are dropped, and outputs of the remaining entries (e.g. from an earlier
+        # run writing into the input directory) are not inputs themselves
+        cache = {key: cached for key, cached in cache.items() if os.path.exists(cached['input'])}
+        known_outputs = {path for cached in cache.values() for path in cached['outputs']}
+        input_paths = [p for p in input_paths if os.path.abspath(p) not in known_outputs]
+
+        files = []
+        pending = []
+        input_abspaths = {os.path.abspath(p) for p in input_paths}
+        used_outputs = set()
+        for input_path in input_paths:
+            input_format = os.path.splitext(input_path)[1].lower().lstrip('.')
+            stem = os.path.splitext(os.path.basename(input_path))[0]
+            output_path = os.path.join(output_dir, f"{stem}.{output_format}")
+            entry = {'input': input_path}
+            try:
+                outputs = self._batch_output_paths(output_path, input_path, input_format)
+            except ValueError as e:
+                entry.update(outputs=[], status='error', result={'type': 'error', 'message': str(e)})
+                files.append(entry)
+                continue
+            output_abspaths = [os.path.abspath(path) for path in outputs]
+            # files already in the output format and location are left as they are
+            if output_abspaths == [os.path.abspath(input_path)]:
+                logging.info(f"Skipping {input_path}, already in {output_format} format")
+                continue
+            entry['outputs'] = outputs
+            files.append(entry)
+
+            # never overwrite another input file or the output of another input with the same name
+            if any(path in input_abspaths for path in output_abspaths):
+                entry.update(status='error', result={'type': 'error', 'message': 'Output path is another input file'})
+                continue
+            if any(path in used_outputs for path in output_abspaths):
+                entry.update(status='error', result={'type': 'error', 'message': 'Output path used by another input'})
+                continue
+            used_outputs.update(output_abspaths)
+
+            stat = os.stat(input_path)
+            options = {'input_format': input_format, 'output_format': output_format, 'flatten': flatten}
+            # skip unchanged inputs as long as their outputs still exist, the content hash is only
+            # compared in the worker when size or modification time differ
+            key = os.path.abspath(output_path)
+            cached = cache.get(key)
+            cached_hash = None
+            if (cached and cached['input'] == os.path.abspath(input_path) and cached['options'] == options and cached['outputs'] == output_abspaths
+                    and all(os.path.exists(path) for path in outputs)):
+                if (cached['size'], cached['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+                    entry.update(status='cached', result=cached['result'])
+                    continue
+                cached_hash = cached['content_hash']
+            previous_outputs = cached['outputs'] if cached else []
+            pending.append((entry, key, stat, options, output_path, output_abspaths, previous_outputs, cached_hash))
+
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_batch_worker,
+                                     initargs=(self.config_path,)) as executor:
+                futures = [
+                    (entry, key, stat, options, output_abspaths,
+                     executor.submit(_batch_convert_file, entry['input'], output_path, output_abspaths, options,
+                                     previous_outputs, cached_hash))
+                    for entry, key, stat, options, output_path, output_abspaths, previous_outputs, cached_hash in pending
+                ]
+                for entry, key, stat, options, output_abspaths, future in futures:
+                    result, content_hash = future.result()
+                    if result['type'] == 'cached':
+                        entry.update(status='cached', result=cache[key]['result'])
+                        cache[key].update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                    elif result['type'] == 'success':
+                        entry.update(status='converted', result=result)
+                        cache[key] = {
+                            'input': os.path.abspath(entry['input']), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'content_hash': content_hash,
+                            'options': options, 'outputs': output_abspaths, 'result': result
+                        }
+                    else:
+                        # the previous outputs were removed before converting, so the entry is stale
+                        entry.update(status=result['type'], result=result)
+                        cache.pop(key, None)
+        finally:
+            if cache_path:
+                self.write_json(cache, cache_path)
+
+        elapsed_time = (time.time() - start_time) * 1000
+        statuses = [entry['status'] for entry in files]
+        converted = [entry for entry in files if entry['status'] == 'converted']
+        summary = {
+            'total': len(files),
+            'converted': statuses.count('converted'),
+            'cached': statuses.count('cached'),
+            'semi_data_warnings': statuses.count('semi_data_warning'),
+            'errors': statuses.count('error'),
+            'rows': sum(entry['result']['timing'].get('rows', 0) for entry in converted),
+            'conversion_ms': sum(entry['result']['timing']['elapsed_ms'] for entry in converted),
+            'elapsed_ms': elapsed_time
+        }
+        logging.info(f"Batch conversion completed in {elapsed_time:.2f} ms")
+
+        return {
+            'type': 'success',
+            'message': 'Batch conversion completed',
+            'output_format': output_format,
+            'summary': summary,
+            'files': files
+        }
+
+# batch conversion runs in worker processes, each creating its own transformer
+# since the loaded C library can't be shared between processes
+_batch_transformer = None
+
+def _init_batch_worker(config_path):
+    global _batch_transformer
+    _batch_transformer = DataTransformer(config_path)
+
+def _batch_convert_file(input_path, output_path, output_paths, options, previous_outputs, cached_hash):
+    try:
+        content_hash = _batch_transformer._hash_file(input_path)
+        # only the modification time changed, the outputs are still up to date
+        if content_hash == cached_hash:
+            return {'type': 'cached'}, content_hash
+        # SQLite output appends to existing tables, so outputs of an earlier run are removed first
+        for path in set(output_paths + previous_outputs):
+            if os.path.exists(path):
+                os.remove(path)
+        result = _batch_transformer.convert(input_path, output_path, options['input_format'],
+                                            options['output_format'], flatten=options['flatten'])
+        return result, content_hash
+    except Exception as e:
+        return {'type': 'error', 'message': str(e)}, None
+
 class NestedDataWarning(Warning):
     pass
 
@@ -623,21 +1025,53 @@ class DataTransformerCLI:
         convert_parser = subparsers.add_parser('convert', aliases=['c'], help='Convert data from one format to another.')
         convert_parser.add_argument('input', help='Path to the input file.')
         convert_parser.add_argument('output', help='Path to the output file.')
+        self._add_shard_arguments(convert_parser)
 
         # generate command
         generate_parser = subparsers.add_parser('generate', aliases=['g'], help='Generate mock data.')
         generate_parser.add_argument('rows', type=int, help='Number of rows to generate.')
         generate_parser.add_argument('output', help='Path to the output file.')
         generate_parser.add_argument('--config', '-C', help='Path to the configuration file. Uses default if not specified.')
+        self._add_shard_arguments(generate_parser)
+
+        # batch command
+        batch_parser = subparsers.add_parser('batch', aliases=['b'], help='Convert all files in a directory or glob to one format.')
+        batch_parser.add_argument('input', help='Input directory or glob pattern, e.g. "exports/*.json".')
+        batch_parser.add_argument('format', choices=self.transformer.supported_formats, help='Output format.')
+        batch_parser.add_argument('--output-dir', '-o', help='Output directory. Uses the input directory if not specified.')
+        batch_parser.add_argument('--workers', '-w', type=int, help='Number of worker processes. Uses the CPU count if not specified.')
+        batch_parser.add_argument('--flatten', action='store_true', help='Flatten nested or irregular data for CSV/SQLite output.')
+        batch_parser.add_argument('--cache', help='Path to the skip cache. Defaults to .dsxform_cache.json in the output directory.')
+        batch_parser.add_argument('--no-cache', action='store_true', help='Convert all files without reading or writing the cache.')
+        batch_parser.add_argument('--report', help='Path to write the summary report as JSON.')
 
         args = parser.parse_args()
 
         if args.command in ('convert', 'c'):
-            self.handle_convert(args.input, args.output)
+            self.handle_convert(args.input, args.output, args.shard_rows, args.shards)
         elif args.command in ('generate', 'g'):
-            self.handle_generate(args.rows, args.output, args.config)
+            self.handle_generate(args.rows, args.output, args.config, args.shard_rows, args.shards)
+        elif args.command in ('batch', 'b'):
+            self.handle_batch(args.input, args.format, args.output_dir, args.workers, args.flatten,
+                              None if args.no_cache else args.cache or '', args.report)
+
+    def _add_shard_arguments(self, subparser):
+        shard_group = subparser.add_mutually_exclusive_group()
+        shard_group.add_argument('--shard-rows', type=int,
+                                 help='Split the output into shard files with at most this many rows each.')
+        shard_group.add_argument('--shards', type=int,
+                                 help='Split the output into this many similarly sized shard files.')
 
-    def handle_convert(self, input_path, output_path):
+    def _validate_shard_arguments(self, shard_rows, shards):
+        if shard_rows is not None and shard_rows < 1:
+            print("Error: --shard-rows must be a positive integer.")
+            return False
+        if shards is not None and shards < 1:
+            print("Error: --shards must be a positive integer.")
+            return False
+        return True
+
+    def handle_convert(self, input_path, output_path, shard_rows=None, shards=None):
         if not os.path.exists(input_path):
             print(f"Error: Input file '{input_path}' does not exist.")
             return
@@ -655,24 +1089,82 @@ class DataTransformerCLI:
         if not output_format:
             print(f"Unsupported output format: {output_ext}")
             return
+        if not self._validate_shard_arguments(shard_rows, shards):
+            return
+
+        sharded = shard_rows is not None or shards is not None
+
+        def run_convert(flatten):
+            if sharded:
+                return self.transformer.convert_sharded(input_path, output_path, input_format, output_format,
+                                                        flatten=flatten, shard_rows=shard_rows, shards=shards)
+            return self.transformer.convert(input_path, output_path, input_format, output_format,
+                                            flatten=flatten)
 
         try:
             # convert dataset
-            result = self.transformer.convert(input_path, output_path, input_format, output_format,
-                                  flatten=False)
+            result = run_convert(flatten=False)
             if result['type'] == 'semi_data_warning':
                 response = input("Irregular or nested data detected. Flatten it for structured output? y/n ").strip().lower()
                 if response == 'y':
-                    self.transformer.convert(input_path, output_path, input_format, output_format, flatten=True)
+                    result = run_convert(flatten=True)
                     print(f"Successfully converted '{input_path}' to '{output_path}' with flattening.")
                 else:
                     print("Conversion aborted by user.")
+                    return
             else:
                 print(f"Successfully converted '{input_path}' to '{output_path}'.")
+            if sharded:
+                print(f"Wrote {len(result['shards'])} shards, manifest: '{result['manifest_path']}'.")
         except Exception as e:
             print(f"Conversion failed: {str(e)}")
 
-    def handle_generate(self, rows, output_path, config_path=None):
+    def handle_batch(self, input_pattern, output_format, output_dir=None, workers=None, flatten=False,
+                     cache_path='', report_path=None):
+        # cache_path of None disables the cache, an empty string uses the default location
+        input_paths = self.transformer.collect_batch_inputs(input_pattern)
+        if not input_paths:
+            print(f"Error: No supported input files found for '{input_pattern}'.")
+            return
+        if workers is not None and workers < 1:
+            print("Error: --workers must be a positive integer.")
+            return
+
+        if not output_dir:
+            output_dir = input_pattern if os.path.isdir(input_pattern) else os.path.dirname(input_paths[0]) or '.'
+        if cache_path == '':
+            cache_path = os.path.join(output_dir, '.dsxform_cache.json')
+
+        try:
+            report = self.transformer.batch_convert(input_paths, output_dir, output_format, flatten=flatten,
+                                                    cache_path=cache_path, max_workers=workers)
+        except Exception as e:
+            print(f"Batch conversion failed: {str(e)}")
+            return
+
+        for entry in report['files']:
+            if entry['status'] == 'converted':
+                outputs = ', '.join(f"'{path}'" for path in entry['outputs'])
+                print(f"Converted '{entry['input']}' to {outputs}.")
+            elif entry['status'] == 'cached':
+                print(f"Skipped unchanged '{entry['input']}'.")
+            elif entry['status'] == 'semi_data_warning':
+                print(f"Skipped '{entry['input']}': irregular or nested data detected, use --flatten to convert it.")
+            else:
+                print(f"Failed '{entry['input']}': {entry['result']['message']}")
+
+        summary = report['summary']
+        print(f"Batch conversion: {summary['converted']} converted, {summary['cached']} unchanged, "
+              f"{summary['semi_data_warnings']} need flattening, {summary['errors']} failed "
+              f"({summary['rows']} rows in {summary['elapsed_ms']:.2f} ms).")
+        if report_path:
+            try:
+                self.transformer.write_json(report, report_path)
+                print(f"Report written to '{report_path}'.")
+            except ValueError as e:
+                print(f"Error: {str(e)}")
+
+    def handle_generate(self, rows, output_path, config_path=None, shard_rows=None, shards=None):
         # determine output format
         output_ext = os.path.splitext(output_path)[1].lower()
         output_format = self.format_mapping.get(output_ext)
@@ -680,6 +1172,8 @@ class DataTransformerCLI:
         if not output_format:
             print(f"Unsupported output format: {output_ext}")
             return
+        if not self._validate_shard_arguments(shard_rows, shards):
+            return
         
         # set config path if provided
         if config_path:
@@ -689,8 +1183,14 @@ class DataTransformerCLI:
             self.transformer.config_path = config_path
 
         try:
-            self.transformer.generate_data(rows, output_path, output_format)
-            print(f"Successfully generated {rows} rows into '{output_path}'.")
+            if shard_rows is not None or shards is not None:
+                result = self.transformer.generate_data_sharded(rows, output_path, output_format,
+                                                                shard_rows=shard_rows, shards=shards)
+                print(f"Successfully generated {rows} rows into {len(result['shards'])} shards, "
+                      f"manifest: '{result['manifest_path']}'.")
+            else:
+                self.transformer.generate_data(rows, output_path, output_format)
+                print(f"Successfully generated {rows} rows into '{output_path}'.")
         except Exception as e:
             print(f"Data generation failed: {str(e)}")
 